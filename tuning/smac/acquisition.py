@@ -0,0 +1,83 @@
+"""Numba-accelerated acquisition function maximizer for SMAC3.
+
+SMAC's default local search scores acquisition values one candidate
+configuration at a time via Python dispatch, which becomes the dominant cost
+between trials when the target function itself is fast.  The maximizer here
+scores the whole candidate batch with a parallel LLVM-compiled kernel over
+contiguous float64 arrays instead.
+"""
+
+import math
+import os
+
+# persist the JIT cache next to this file so all Dask workers share it across
+# runs instead of each recompiling; must be set before numba is imported
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache"))
+
+import numpy as np
+from ConfigSpace.util import get_one_exchange_neighbourhood
+from numba import njit, prange
+from smac.acquisition.maximizer import LocalAndSortedRandomSearch
+
+_SQRT2 = math.sqrt(2.0)
+_SQRT2PI = math.sqrt(2.0 * math.pi)
+
+#: number of random candidates scored per maximization; independent of the
+#: `n_points` challenger count SMAC requests (5000 by default)
+_N_RANDOM_CANDIDATES = 4096
+#: number of recent configurations whose one-exchange neighborhoods are scored
+_N_NEIGHBORHOOD_SOURCES = 8
+
+
+# the explicit signature makes compilation (or loading the disk cache) happen
+# eagerly at import time instead of at the first trial
+@njit("f8[:](f8[:,:], f8[:], f8[:], f8)", parallel=True, fastmath=True, cache=True)
+def score(X, mu, sigma, f_min):
+    """Expected improvement for a batch of candidates with predictions mu/sigma.
+
+    X is the (n_candidates, n_dims) float64 array of vectorized configurations;
+    it is accepted so that kernels needing the raw candidates (e.g. for priors)
+    keep the same signature.
+    """
+    n = mu.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        s = sigma[i]
+        if s <= 0.0:
+            out[i] = 0.0
+        else:
+            u = (f_min - mu[i]) / s
+            pdf = math.exp(-0.5 * u * u) / _SQRT2PI
+            cdf = 0.5 * (1.0 + math.erf(u / _SQRT2))
+            out[i] = (f_min - mu[i]) * cdf + s * pdf
+    return out
+
+
+class NumbaLocalAndSortedRandomSearch(LocalAndSortedRandomSearch):
+    """Local and sorted random search scoring candidate batches with a Numba kernel.
+
+    Instead of calling the acquisition function per candidate, all candidates of
+    an iteration are vectorized into one contiguous (n_candidates, n_dims) array
+    (`Configuration.get_array` already encodes categoricals as indices) and
+    scored with the parallel `score` kernel in a single call.
+    """
+
+    def _maximize(self, previous_configs, n_points):
+        candidates = list(
+            self._configspace.sample_configuration(size=_N_RANDOM_CANDIDATES))
+        for config in previous_configs[-_N_NEIGHBORHOOD_SOURCES:]:
+            candidates += list(
+                get_one_exchange_neighbourhood(config, seed=self._seed))
+        X = np.array([config.get_array() for config in candidates],
+                     dtype=np.float64)
+        model = self._acquisition_function.model
+        mu, var = model.predict_marginalized(X)
+        sigma = np.sqrt(np.maximum(var.ravel(), 0.0))
+        f_min = getattr(self._acquisition_function, "_eta", None)
+        if f_min is None:
+            f_min = float(mu.min())
+        values = score(X, mu.ravel(), sigma, float(f_min))
+        order = np.argsort(values)[::-1][:n_points]
+        return [(float(values[i]), candidates[i]) for i in order]
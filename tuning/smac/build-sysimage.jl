@@ -0,0 +1,31 @@
+#!/usr/bin/env julia
+"""
+    build-sysimage.jl
+
+Build a custom sysimage `sysimg.so` containing MHLib and the compiled code
+exercised by running `julia-function-to-tune.jl`.  Starting the Julia
+processes spawned by `julia_server.py` with this sysimage skips package
+loading and recompilation of that exercised code on every worker start.
+Note that `f` itself is defined in a script, not a package, so its
+definition is still included (parsed) by `julia-server-loop.jl` at server
+start; to bake it into the image completely, move it into a package listed
+below.
+
+Run once before a tuning campaign:
+
+    julia build-sysimage.jl
+"""
+
+using Pkg
+
+# work in a temporary environment providing PackageCompiler plus this
+# repository's MHLib, so the script runs regardless of the caller's project
+Pkg.activate(temp=true)
+Pkg.add("PackageCompiler")
+Pkg.develop(path=joinpath(@__DIR__, "..", ".."))
+
+using PackageCompiler
+
+create_sysimage([:MHLib];
+    sysimage_path=joinpath(@__DIR__, "sysimg.so"),
+    precompile_execution_file=joinpath(@__DIR__, "julia-function-to-tune.jl"))
@@ -0,0 +1,23 @@
+#!/usr/bin/env julia
+"""
+    call-julia-function-f.jl
+
+Evaluate the function to tune once for the parameters given as command line
+arguments and print the resulting cost in the form expected by SMAC3.
+Usable standalone or as an SMAC script target function, spawning a fresh
+Julia process per trial; the variants in `tuning.py` all use persistent
+Julia processes instead.
+
+Arguments: instance seed x y z
+"""
+
+include("julia-function-to-tune.jl")
+
+let
+    instance = ARGS[1]
+    seed = parse(Int, ARGS[2])
+    x = parse(Float64, ARGS[3])
+    y = parse(Int, ARGS[4])
+    z = ARGS[5]
+    println("cost=", f(instance, seed, x, y, z))
+end
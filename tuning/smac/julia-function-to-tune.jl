@@ -0,0 +1,34 @@
+"""
+    julia-function-to-tune.jl
+
+Exemplary Julia function whose parameters are tuned with SMAC3.
+In a real application replace `f` by a function that runs the actual algorithm
+to tune on the given problem instance and returns the cost to be minimized.
+"""
+
+using Random
+
+"""
+    Z
+
+Values of the categorical parameter `z`; transmitted as 0-based `Int8` index
+in the binary frame protocol.
+"""
+const Z = ("opt1", "opt2")
+
+"""
+    f(instance, seed, x, y, z)
+
+Exemplary function to tune, returning the cost value for the given parameters.
+
+- `instance`: name of the problem instance to solve
+- `seed`: random seed to use
+- `x`, `y`, `z`: parameters to tune
+"""
+function f(instance::AbstractString, seed::Integer, x::Float64, y::Integer,
+        z::AbstractString)
+    Random.seed!(seed)
+    res = (x - 1.5)^2 + (y - 7)^2 / 10 + rand()
+    z == "opt2" && (res -= 0.5)
+    res
+end
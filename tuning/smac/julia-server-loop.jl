@@ -0,0 +1,84 @@
+"""
+    julia-server-loop.jl
+
+Server loop for evaluating the function to tune on behalf of `julia_server.py`.
+
+Requests are received on stdin as fixed-width binary frames and the resulting
+cost values are written back to stdout as raw `Float64`s.
+No Julia code is parsed or evaluated per request; the whole loop is compiled
+once when this script starts.
+
+Each batch starts with the number of requests as an `Int64`, followed by that
+many request records; the records of a batch are evaluated multithreaded.
+Request record layout (little-endian, 57 bytes):
+- `instance`: 32 bytes, NUL-padded UTF-8
+- `seed`: `Int64`
+- `x`: `Float64`
+- `y`: `Int64`
+- `z`: `Int8`, 0-based index into the value table `Z`
+
+Reply frame layout: one `Float64` (8 bytes) per request of the batch.
+"""
+
+include("julia-function-to-tune.jl")
+
+"""
+    Request
+
+One parsed request record for evaluating the function to tune.
+"""
+struct Request
+    instance::String
+    seed::Int64
+    x::Float64
+    y::Int64
+    z::String
+end
+
+"""
+    read_padded_string(io, n)
+
+Read a NUL-padded string of `n` bytes from `io` and strip the padding.
+"""
+function read_padded_string(io::IO, n::Int)
+    b = read(io, n)
+    i = findfirst(iszero, b)
+    String(i === nothing ? b : b[1:i-1])
+end
+
+"""
+    read_request(io)
+
+Read one request record from `io`.
+"""
+function read_request(io::IO)
+    instance = read_padded_string(io, 32)
+    seed = read(io, Int64)
+    x = read(io, Float64)
+    y = read(io, Int64)
+    z = Z[read(io, Int8) + 1]
+    Request(instance, seed, x, y, z)
+end
+
+"""
+    serve(io_in, io_out)
+
+Repeatedly read request batches from `io_in`, evaluate `f` for each record
+with multithreading, and write the resulting cost values to `io_out` until
+`io_in` is closed.
+"""
+function serve(io_in::IO=stdin, io_out::IO=stdout)
+    while !eof(io_in)
+        n = Int(read(io_in, Int64))
+        requests = [read_request(io_in) for _ in 1:n]
+        res = Vector{Float64}(undef, n)
+        Threads.@threads for i in 1:n
+            r = requests[i]
+            res[i] = f(r.instance, r.seed, r.x, r.y, r.z)
+        end
+        write(io_out, res)
+        flush(io_out)
+    end
+end
+
+serve()
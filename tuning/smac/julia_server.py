@@ -0,0 +1,262 @@
+"""Target function for SMAC3 evaluating a Julia function in a persistent subprocess.
+
+A single Julia process running `julia-server-loop.jl` is started lazily per
+worker process — under Dask once per worker via the `JuliaPlugin` worker
+plugin, which variant 2 of `tuning.py` registers on its cluster — so
+importing this module on every task stays cheap and Julia startup is
+amortized over all trials a worker executes.  Each trial exchanges a
+fixed-width binary request frame and an eight-byte `Float64` reply over the
+raw pipe file descriptors, so per call neither Julia source code has to be
+parsed/evaluated nor any Python strings built; see `julia-server-loop.jl`
+for the frame layout.
+"""
+
+import fcntl
+import logging
+import os
+import select
+import struct
+import subprocess
+import time
+from dataclasses import dataclass
+
+from dask.distributed import WorkerPlugin, get_worker
+from smac.runhistory import TrialValue
+from smac.runhistory.enumerations import StatusType
+from smac.runner.abstract_runner import AbstractRunner
+
+logger = logging.getLogger(__name__)
+
+#: index of each value of the categorical parameter z in the value table
+#: `Z` of julia-function-to-tune.jl
+Z_TABLE = {"opt1": 0, "opt2": 1}
+
+
+@dataclass(slots=True, frozen=True)
+class Params:
+    """Parameters of the function to tune, unpacked once per configuration.
+
+    Every `config["..."]` access hashes a string key and coerces the value;
+    the wrappers therefore unpack a configuration into this slotted struct
+    exactly once and pass it around.  `z_index` is the wire encoding of `z`.
+    """
+
+    x: float
+    y: int
+    z: str
+    z_index: int
+
+    @classmethod
+    def from_config(cls, config) -> "Params":
+        z = str(config["z"])
+        return cls(float(config["x"]), int(config["y"]), z, Z_TABLE[z])
+
+
+_COUNT = struct.Struct("<q")
+_INSTANCE_LEN = 32
+_REQUEST = struct.Struct("<32sqdqb")
+_REPLY_SIZE = 8
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+SYSIMAGE = os.path.join(_DIR, "sysimg.so")
+
+
+def julia_argv() -> list:
+    """Command line for starting a Julia server process.
+
+    The sysimage built by `build-sysimage.jl` is used when present, avoiding
+    package loading and recompilation of the code it covers at every process
+    start; the script-defined `f` itself is still included by the server loop.
+    """
+    argv = ["julia"]
+    if os.path.exists(SYSIMAGE):
+        argv.append(f"--sysimage={SYSIMAGE}")
+    argv += ["--threads=auto", "--startup-file=no", "--history-file=no", "-q",
+             "julia-server-loop.jl"]
+    return argv
+
+
+class JuliaServer:
+    """Handle for one Julia server process with raw request/response pipes.
+
+    The pipes are created with `os.pipe` and driven directly via
+    `os.write`/`os.read` rather than through `subprocess.PIPE` file objects,
+    bypassing Python's buffered-reader state machine; the response end is
+    non-blocking and polled with `select` while reading fixed-size frames.
+    """
+
+    def __init__(self):
+        request_read, request_write = os.pipe()
+        response_read, response_write = os.pipe()
+        self.proc = subprocess.Popen(
+            julia_argv(),
+            stdin=request_read,
+            stdout=response_write,
+            cwd=_DIR,
+        )
+        os.close(request_read)
+        os.close(response_write)
+        fcntl.fcntl(response_read, fcntl.F_SETFL,
+                    fcntl.fcntl(response_read, fcntl.F_GETFL) | os.O_NONBLOCK)
+        self.request_fd = request_write
+        self.response_fd = response_read
+
+    def kill(self):
+        os.close(self.request_fd)
+        os.close(self.response_fd)
+        self.proc.kill()
+
+
+def start_julia() -> JuliaServer:
+    """Start a Julia server process speaking the binary frame protocol."""
+    return JuliaServer()
+
+
+class JuliaPlugin(WorkerPlugin):
+    """Dask worker plugin starting one persistent Julia server per worker.
+
+    Register via `client.register_plugin(JuliaPlugin())` so that Julia
+    startup is paid once per worker instead of once per trial.
+    """
+
+    def setup(self, worker):
+        logging.basicConfig(level=logging.WARNING)
+        worker.julia = start_julia()
+
+    def teardown(self, worker):
+        worker.julia.kill()
+
+
+_julia = None
+
+
+def _get_julia() -> JuliaServer:
+    """Return the Julia server for the current context, starting it if necessary.
+
+    On a Dask worker this is the per-worker process set up by `JuliaPlugin`,
+    otherwise a lazily started module-level singleton.
+    """
+    global _julia
+    try:
+        return get_worker().julia
+    except (ValueError, AttributeError):
+        pass
+    if _julia is None:
+        _julia = start_julia()
+    return _julia
+
+
+def _read_exact(fd: int, n: int) -> bytes:
+    """Read exactly n bytes from the non-blocking file descriptor."""
+    buf = b""
+    while len(buf) < n:
+        select.select([fd], [], [])
+        try:
+            chunk = os.read(fd, n - len(buf))
+        except BlockingIOError:
+            continue
+        if not chunk:
+            raise EOFError("Julia server terminated unexpectedly")
+        buf += chunk
+    return buf
+
+
+def pack_batch(requests: list) -> bytes:
+    """Encode a batch of `(instance, seed, x, y, z_index)` requests as one frame.
+
+    `struct` would silently truncate over-long instance names to the
+    fixed-width field, so they are rejected explicitly.
+    """
+    frame = [_COUNT.pack(len(requests))]
+    for instance, seed, x, y, z_index in requests:
+        name = instance.encode()
+        if len(name) > _INSTANCE_LEN:
+            raise ValueError(
+                f"instance name exceeds {_INSTANCE_LEN} bytes: {instance!r}")
+        frame.append(_REQUEST.pack(name, seed, x, y, z_index))
+    return b"".join(frame)
+
+
+def batch_f(requests: list, server: JuliaServer = None) -> list:
+    """Evaluate a batch of `(instance, seed, x, y, z_index)` requests in one round trip.
+
+    The whole batch is sent as a single count-prefixed frame and evaluated
+    multithreaded on the Julia side, amortizing the Python-Julia handshake
+    over all requests.  Uses the Julia process of the current context unless
+    a specific `server` is given.
+    """
+    proc = server if server is not None else _get_julia()
+    os.write(proc.request_fd, pack_batch(requests))
+    data = _read_exact(proc.response_fd, _REPLY_SIZE * len(requests))
+    return list(struct.unpack(f"<{len(requests)}d", data))
+
+
+def f(config, instance: str, seed: int = 0, server: JuliaServer = None) -> float:
+    """Evaluate the Julia function f for the given configuration and return its cost.
+
+    Uses the Julia process of the current context unless a specific `server`
+    is given.
+    """
+    p = Params.from_config(config)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("f(%s, %s, %s, %s, %s)", instance, seed, p.x, p.y, p.z)
+    res = batch_f([(instance, seed, p.x, p.y, p.z_index)], server)[0]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("result of f: %s", res)
+    return res
+
+
+class BatchedJuliaRunner(AbstractRunner):
+    """Runner buffering submitted trials and evaluating them as one Julia batch.
+
+    Submitted trials are collected until `batch_size` configurations have
+    accumulated and then sent to the Julia server as a single batch frame.
+    SMAC polls `iter_results` after every submission, so partial batches are
+    flushed only from `wait()` — flushing on every poll would reduce each
+    batch to a single trial.  Use with a `Scenario` of `n_workers=1`: with
+    more workers SMAC wraps the runner in its Dask runner, which bypasses
+    `submit_trial` batching entirely.
+    """
+
+    def __init__(self, scenario, batch_size: int = 4):
+        super().__init__(scenario=scenario,
+                         required_arguments=["instance", "seed"])
+        self._batch_size = batch_size
+        self._pending = []
+        self._results = []
+
+    def submit_trial(self, trial_info) -> None:
+        self._pending.append(trial_info)
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def iter_results(self):
+        while self._results:
+            yield self._results.pop(0)
+
+    def run(self, config, instance: str = None, budget: float = None,
+            seed: int = 0, **kwargs) -> tuple:
+        """Evaluate a single configuration, conforming to the runner contract."""
+        start, cpu_start = time.time(), time.process_time()
+        cost = f(config, instance, seed)
+        return (StatusType.SUCCESS, cost, time.time() - start,
+                time.process_time() - cpu_start, {})
+
+    def wait(self) -> None:
+        if self._pending:
+            self._flush()
+
+    def is_running(self) -> bool:
+        return bool(self._pending or self._results)
+
+    def count_available_workers(self) -> int:
+        return self._batch_size - len(self._pending)
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        requests = []
+        for info in batch:
+            p = Params.from_config(info.config)
+            requests.append((info.instance, info.seed, p.x, p.y, p.z_index))
+        for info, cost in zip(batch, batch_f(requests)):
+            self._results.append((info, TrialValue(cost=cost)))
@@ -0,0 +1,70 @@
+"""Asynchronous variant of `julia_server.py` based on asyncio subprocesses.
+
+`julia_server.f` blocks on the server's reply, so nothing else happens in the
+calling process while Julia computes.  The coroutines here await the reply
+instead, letting SMAC bookkeeping and acquisition maximization on the main
+process overlap with Julia computation on the workers.  Frame protocol and
+sysimage handling are shared with `julia_server.py`.
+"""
+
+import asyncio
+import logging
+import struct
+
+from julia_server import _DIR, _REPLY_SIZE, Params, julia_argv, pack_batch
+
+logger = logging.getLogger(__name__)
+
+_julia = None
+_loop = None
+
+
+async def start_julia() -> asyncio.subprocess.Process:
+    """Start a Julia server process speaking the binary frame protocol."""
+    argv = julia_argv()
+    return await asyncio.create_subprocess_exec(
+        *argv,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        cwd=_DIR,
+    )
+
+
+async def _get_julia() -> asyncio.subprocess.Process:
+    """Return the process-wide Julia server, starting it if necessary."""
+    global _julia
+    if _julia is None:
+        _julia = await start_julia()
+    return _julia
+
+
+async def batch_f(requests: list, server=None) -> list:
+    """Evaluate a batch of `(instance, seed, x, y, z_index)` requests in one round trip."""
+    proc = server if server is not None else await _get_julia()
+    proc.stdin.write(pack_batch(requests))
+    await proc.stdin.drain()
+    data = await proc.stdout.readexactly(_REPLY_SIZE * len(requests))
+    return list(struct.unpack(f"<{len(requests)}d", data))
+
+
+async def f(config, instance: str, seed: int = 0, server=None) -> float:
+    """Evaluate the Julia function f for the given configuration and return its cost."""
+    p = Params.from_config(config)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("f(%s, %s, %s, %s, %s)", instance, seed, p.x, p.y, p.z)
+    res = (await batch_f([(instance, seed, p.x, p.y, p.z_index)], server))[0]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("result of f: %s", res)
+    return res
+
+
+def run_f(config, instance: str, seed: int = 0) -> float:
+    """Synchronous entry point driving `f` on a persistent event loop.
+
+    The loop is kept alive across calls since the cached server's pipe
+    transports are bound to it.
+    """
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(f(config, instance, seed))
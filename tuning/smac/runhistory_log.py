@@ -0,0 +1,31 @@
+"""Append-only NDJSON trial log for SMAC3 runs.
+
+SMAC rewrites its complete JSON runhistory after every trial, so the
+cumulative bytes written grow quadratically with the number of trials.  The
+callback here additionally streams each finished trial as one JSON line to an
+append-only file, which grows O(1) per trial and can be read back with any
+NDJSON tool while the run is still in progress.
+"""
+
+import json
+
+from smac.callback import Callback
+
+
+class NDJSONRunHistoryCallback(Callback):
+    """Callback appending one JSON line per finished trial to a log file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a", buffering=1)
+
+    def on_tell_end(self, smbo, info, value) -> None:
+        entry = {
+            "config": dict(info.config),
+            "instance": info.instance,
+            "seed": info.seed,
+            "budget": info.budget,
+            "cost": value.cost,
+            "time": value.time,
+            "status": int(value.status),
+        }
+        self._file.write(json.dumps(entry) + "\n")
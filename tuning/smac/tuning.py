@@ -0,0 +1,143 @@
+"""Demo for tuning parameters of a Julia function with SMAC3.
+
+The function to tune is defined in `julia-function-to-tune.jl`; trials are
+distributed over a local Dask cluster.  Three variants for calling Julia are
+provided, selected via the `variant` constant:
+
+1. evaluate the function in-process via juliacall
+2. evaluate via one Julia server per worker of a Dask cluster, set up by
+   `julia_server.JuliaPlugin`
+3. evaluate via a single persistent Julia server from `julia_server.py`
+
+The acquisition function is maximized with the Numba-accelerated batch
+maximizer from `acquisition.py`.
+"""
+
+import logging
+import os
+from functools import lru_cache
+
+from ConfigSpace import Categorical, Configuration, ConfigurationSpace, Float, Integer
+from dask.distributed import Client, LocalCluster
+from smac import AlgorithmConfigurationFacade, Scenario
+
+from acquisition import NumbaLocalAndSortedRandomSearch
+from julia_server import Params
+from runhistory_log import NDJSONRunHistoryCallback
+
+logger = logging.getLogger(__name__)
+
+#: variant for calling the Julia function, see module docstring
+variant = 3
+
+instance_dir = "../../test/data"
+
+
+@lru_cache(None)
+def _list_instances() -> list:
+    """Names of all instances in `instance_dir`, determined once per process.
+
+    `os.scandir` avoids the extra stat per entry that `os.listdir` + filtering
+    would pay, which adds up on network filesystems when every worker imports
+    this module.
+    """
+    return [e.name for e in os.scandir(instance_dir) if e.name.startswith("maxsat")]
+
+
+instances = _list_instances()
+
+config_space = ConfigurationSpace()
+config_space.add([
+    Float("x", (-5.0, 5.0), default=0.0),
+    Integer("y", (0, 10), default=5),
+    Categorical("z", ["opt1", "opt2"], default="opt1"),
+])
+
+if variant == 1:
+    from juliacall import Main as jl
+
+    jl.include("julia-function-to-tune.jl")
+
+    # bind the tuned function once as a typed closure: avoids the getattr on
+    # `jl` and re-specialization of the call per trial
+    _call = jl.seval(
+        "(i, s, x, y, z) -> f(i::String, s::Int, x::Float64, y::Int, z::String)")
+    _jl_instances = {}
+
+    def f(config: Configuration, instance: str, seed: int = 0) -> float:
+        """Evaluate the Julia function f in-process and return its cost."""
+        p = Params.from_config(config)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("f(%s, %s, %s, %s, %s)", instance, seed, p.x, p.y, p.z)
+        jl_instance = _jl_instances.get(instance)
+        if jl_instance is None:
+            jl_instance = _jl_instances[instance] = jl.String(instance)
+        res = _call(jl_instance, seed, p.x, p.y, p.z)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("result of f: %s", res)
+        return res
+
+    target_function = f
+elif variant in (2, 3):
+    # julia_server.f resolves the per-worker server set up by JuliaPlugin
+    # itself (falling back to a process-local one outside Dask)
+    from julia_server import f as target_function
+else:
+    raise ValueError(f"Invalid variant selected: {variant}")
+
+
+if __name__ == "__main__":
+    n_trials = 100
+    if variant == 2:
+        # use all cores, but never more workers than there are trials to run
+        n_workers = min(os.cpu_count() or 1, n_trials)
+    else:
+        # with n_workers > 1 SMAC starts a Dask cluster of its own and
+        # pickles the target function to its workers, which variant 1's
+        # in-process juliacall state cannot survive; variant 3 draws its
+        # parallelism from multithreaded batch evaluation in Julia instead
+        n_workers = 1
+    scenario = Scenario(
+        config_space,
+        instances=instances,
+        n_trials=n_trials,
+        deterministic=False,
+        n_workers=n_workers,
+    )
+    if variant == 2:
+        # variant 2 needs an explicitly managed cluster so that JuliaPlugin
+        # can set up one Julia server per worker; memory_limit=0
+        # disables spilling of task state to disk, which this tiny workload
+        # never needs, and no dashboard means no Bokeh server startup
+        cluster = LocalCluster(
+            threads_per_worker=1,
+            n_workers=n_workers,
+            processes=True,
+            memory_limit=0,
+            dashboard_address=None,
+        )
+        dask_client = Client(cluster)
+        from julia_server import JuliaPlugin
+        dask_client.register_plugin(JuliaPlugin())
+    else:
+        # sequential in this process: with n_workers=1 SMAC involves no Dask
+        # at all, so no graph building or event-loop round trips per trial
+        dask_client = None
+    if variant == 3:
+        # batch the trials of an intensification round into single server
+        # round trips, evaluated multithreaded on the Julia side; size the
+        # batches to the cores available to the Julia threads
+        from julia_server import BatchedJuliaRunner
+        target = BatchedJuliaRunner(scenario, batch_size=os.cpu_count() or 1)
+    else:
+        target = target_function
+    smac = AlgorithmConfigurationFacade(
+        scenario,
+        target,
+        acquisition_maximizer=NumbaLocalAndSortedRandomSearch(config_space),
+        dask_client=dask_client,
+        callbacks=[NDJSONRunHistoryCallback("runhistory.ndjson")],
+        overwrite=True,
+    )
+    incumbent = smac.optimize()
+    print(f"Optimized configuration: {dict(incumbent)}")
@@ -0,0 +1,113 @@
+"""Minimal SMAC3 tuning demo with a trivial Python target function.
+
+Mainly useful for testing the SMAC setup itself, as the evaluation cost of `f`
+is negligible and any per-trial overhead immediately dominates the run time.
+Trials are therefore evaluated in batches by `BatchedRunner`: per-trial Python
+dispatch collapses to one JIT-compiled loop over contiguous arrays.
+"""
+
+import logging
+import random
+import time
+
+import numpy as np
+from ConfigSpace import Configuration, ConfigurationSpace
+from numba import njit
+from smac import HyperparameterOptimizationFacade, Scenario
+from smac.runhistory import TrialValue
+from smac.runhistory.enumerations import StatusType
+from smac.runner.abstract_runner import AbstractRunner
+
+logger = logging.getLogger(__name__)
+
+config_space = ConfigurationSpace({
+    "x": (-5.0, 5.0),
+    "y": (0, 10),
+})
+
+_rng = np.random.default_rng()
+
+
+@njit(cache=True)
+def _batch(x, y, r):
+    """Evaluate f for a whole batch of configurations given as contiguous arrays."""
+    out = np.empty_like(r)
+    for i in range(len(r)):
+        out[i] = x[i] - y[i] + r[i]
+    return out
+
+
+# pre-warm so that compilation (cached across runs) happens at import time
+_batch(np.zeros(1), np.zeros(1), np.zeros(1))
+
+
+def f(config: Configuration, seed: int = 0) -> float:
+    """Trivial function to minimize; scalar reference implementation of `_batch`."""
+    x = float(config["x"])
+    y = int(config["y"])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("f(%s, %s, %s)", seed, x, y)
+    res = x - y + random.random()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("result of f: %s", res)
+    return res
+
+
+class BatchedRunner(AbstractRunner):
+    """Runner buffering submitted trials and evaluating them as one JITed batch.
+
+    Submitted trials are collected until `batch_size` configurations have
+    accumulated; the batch is then vectorized into structure-of-arrays form and
+    evaluated with a single `_batch` call.  SMAC polls `iter_results` after
+    every submission, so partial batches are flushed only from `wait()` —
+    flushing on every poll would reduce each batch to a single trial.
+    """
+
+    def __init__(self, scenario: Scenario, batch_size: int = 16):
+        super().__init__(scenario=scenario, required_arguments=["seed"])
+        self._batch_size = batch_size
+        self._pending = []
+        self._results = []
+
+    def submit_trial(self, trial_info) -> None:
+        self._pending.append(trial_info)
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def iter_results(self):
+        while self._results:
+            yield self._results.pop(0)
+
+    def run(self, config: Configuration, instance: str = None,
+            budget: float = None, seed: int = 0, **kwargs) -> tuple:
+        """Evaluate a single configuration, conforming to the runner contract."""
+        start, cpu_start = time.time(), time.process_time()
+        cost = f(config, seed)
+        return (StatusType.SUCCESS, cost, time.time() - start,
+                time.process_time() - cpu_start, {})
+
+    def wait(self) -> None:
+        if self._pending:
+            self._flush()
+
+    def is_running(self) -> bool:
+        return bool(self._pending or self._results)
+
+    def count_available_workers(self) -> int:
+        return self._batch_size - len(self._pending)
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        x = np.array([info.config["x"] for info in batch], dtype=np.float64)
+        y = np.array([info.config["y"] for info in batch], dtype=np.float64)
+        costs = _batch(x, y, _rng.random(len(batch)))
+        for info, cost in zip(batch, costs):
+            self._results.append((info, TrialValue(cost=float(cost))))
+
+
+if __name__ == "__main__":
+    scenario = Scenario(config_space, n_trials=200, deterministic=False)
+    smac = HyperparameterOptimizationFacade(
+        scenario, BatchedRunner(scenario), overwrite=True)
+    incumbent = smac.optimize()
+    print(f"Optimized configuration: {dict(incumbent)}")